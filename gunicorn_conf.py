@@ -0,0 +1,14 @@
+"""
+Gunicorn configuration for the CosmiCam Flask API.
+
+The API handlers are I/O bound (directory stats, config reads, JSON
+encoding), so threaded workers let concurrent clients overlap their
+syscalls instead of serializing behind a single thread. The in-process
+caches (latest-image cache, config cache, shared CameraSettings) are
+guarded for threaded use.
+"""
+
+bind = '127.0.0.1:5000'
+workers = 2
+threads = 4
+worker_class = 'gthread'
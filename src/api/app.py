@@ -1,5 +1,4 @@
 from flask import Flask
-import logging
 from dotenv import load_dotenv
 
 from src.config import config
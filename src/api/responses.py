@@ -0,0 +1,19 @@
+from flask import Response
+import orjson
+
+def ojson(data, status: int = 200) -> Response:
+    """
+    Build a JSON response using orjson
+
+    orjson serializes straight to bytes and is several times faster than
+    the stdlib json module behind flask.jsonify, which matters on the
+    Pi's CPU. It also encodes datetime objects natively.
+
+    Args:
+        data: Object to serialize (dicts, lists, datetimes, etc.)
+        status: HTTP status code for the response
+
+    Returns:
+        Response: Flask response with application/json content
+    """
+    return Response(orjson.dumps(data), status=status, mimetype='application/json')
@@ -1,33 +1,34 @@
-from flask import Flask, jsonify, Response, request
+from flask import Flask, Response, request
 import logging
 
 from src.utils.auth import require_admin_access
 from src.config import config
-from src.camera import CameraSettings
+from src.camera import get_shared_settings
+from .responses import ojson
 
 def register_camera_routes(app: Flask):
     """
     Register camera-related API routes
-    
+
     Args:
         app: Flask application instance
     """
     logger = logging.getLogger("FLASK")
-    camera_settings = CameraSettings(logger=logger)
-    
+
     @app.route('/api/coordinates', methods=['GET', 'POST'])
     @require_admin_access
     def handle_coordinates() -> Response:
         """Get or update geographic coordinates"""
+        camera_settings = get_shared_settings()
         try:
             if request.method == 'GET':
                 coords = config.get_config('coordinates')
-                return jsonify(coords), 200
+                return ojson(coords, 200)
                 
             elif request.method == 'POST':
                 data = request.get_json()
                 if not data or 'latitude' not in data or 'longitude' not in data:
-                    return jsonify({'error': 'Missing coordinates'}), 400
+                    return ojson({'error': 'Missing coordinates'}, 400)
                     
                 success = camera_settings.update_coordinates(
                     float(data['latitude']),
@@ -35,22 +36,24 @@ def register_camera_routes(app: Flask):
                 )
                 
                 if success:
+                    camera_settings.refresh()
                     camera_settings.update_profile_from_sun_phase()
-                    return jsonify({'message': 'Coordinates updated successfully'}), 200
+                    return ojson({'message': 'Coordinates updated successfully'}, 200)
                 else:
-                    return jsonify({'error': 'Failed to update coordinates'}), 500
+                    return ojson({'error': 'Failed to update coordinates'}, 500)
                     
         except Exception as e:
             logger.exception("Error handling coordinates")
-            return jsonify({'error': str(e)}), 500
+            return ojson({'error': str(e)}, 500)
 
     @app.route('/api/camera/profile', methods=['GET'])
     def get_camera_profile() -> Response:
         """Get current camera profile and settings"""
+        camera_settings = get_shared_settings()
         try:
             # First update the profile based on sun phase
             camera_settings.update_profile_from_sun_phase()
-            logger.info(f"Updated profile based on sun phase: {camera_settings.current_profile}")
+            logger.info("Updated profile based on sun phase: %s", camera_settings.current_profile)
             
             # Then get the current settings and sun phase
             current_settings = camera_settings.get_current_settings()
@@ -62,9 +65,9 @@ def register_camera_routes(app: Flask):
                 'sun_phase': sun_phase
             }
             
-            logger.debug(f"Returning camera profile data: {response_data}")
-            return jsonify(response_data), 200
+            logger.debug("Returning camera profile data: %s", response_data)
+            return ojson(response_data, 200)
             
         except Exception as e:
             logger.exception("Error getting camera profile")
-            return jsonify({'error': str(e)}), 500
+            return ojson({'error': str(e)}, 500)
@@ -1,10 +1,53 @@
 import os
+import threading
 from datetime import datetime
-from flask import Flask, jsonify, Response
+from flask import Flask, send_from_directory, Response
 import logging
 
 from src.config import config
-from src.camera import CameraSettings
+from src.camera import get_shared_settings
+from .responses import ojson
+
+# Cache of the newest image, keyed on the directory's own mtime. The directory
+# mtime changes whenever a file is added or removed, so a matching mtime means
+# the cached answer is still valid and the per-request scandir can be skipped.
+# Only primitives are stored -- DirEntry objects are not safe to keep past
+# their scandir context.
+_latest_cache = {'dir_mtime': None, 'name': None, 'ctime': 0}
+_latest_cache_lock = threading.Lock()
+
+def _scan_for_latest(image_dir: str, logger) -> tuple:
+    """
+    Scan the image directory for the newest image file
+
+    Args:
+        image_dir: Directory to scan
+        logger: Logger instance for warnings
+
+    Returns:
+        tuple: (filename, ctime) of the newest image, or (None, 0) if none found
+    """
+    latest_name = None
+    latest_time = 0
+
+    with os.scandir(image_dir) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if not entry.name.lower().endswith(('.jpg', '.jpeg', '.png')):
+                continue
+            try:
+                # follow_symlinks=False avoids an extra symlink resolution
+                # per entry; captured images are always regular files
+                entry_time = entry.stat(follow_symlinks=False).st_ctime
+            except OSError as e:
+                logger.warning("Error accessing file %s: %s", entry.name, e)
+                continue
+            if entry_time > latest_time:
+                latest_time = entry_time
+                latest_name = entry.name
+
+    return latest_name, latest_time
 
 def register_image_routes(app: Flask):
     """
@@ -14,53 +57,39 @@ def register_image_routes(app: Flask):
         app: Flask application instance
     """
     logger = logging.getLogger("FLASK")
-    camera_settings = CameraSettings(logger=logger)
-    
+
     @app.route('/api/latest-image', methods=['GET'])
     def get_latest_image() -> Response:
         """Get the latest captured image"""
+        camera_settings = get_shared_settings()
         image_dir = config.get_image_dir()
-        logger.info(f"Latest-image API called, checking directory: {image_dir}")
+        logger.info("Latest-image API called, checking directory: %s", image_dir)
         
         try:
-            # Define valid image extensions
-            valid_extensions = {'.jpg', '.jpeg', '.png'}
-            
-            # Use a generator to avoid loading all files into memory
-            def get_image_files():
-                with os.scandir(image_dir) as entries:
-                    for entry in entries:
-                        if entry.is_file():
-                            ext = os.path.splitext(entry.name)[1].lower()
-                            if ext in valid_extensions:
-                                yield entry
-
-            # Find latest image
-            latest_entry = None
-            latest_time = 0
-            
-            for entry in get_image_files():
-                try:
-                    entry_time = entry.stat().st_ctime
-                    if entry_time > latest_time:
-                        latest_time = entry_time
-                        latest_entry = entry
-                except OSError as e:
-                    logger.warning(f"Error accessing file {entry.name}: {e}")
-                    continue
-            
-            if not latest_entry:
+            # Check the cache first: one stat of the directory tells us
+            # whether anything was added or removed since the last scan
+            dir_mtime = os.stat(image_dir).st_mtime_ns
+
+            with _latest_cache_lock:
+                if _latest_cache['dir_mtime'] == dir_mtime and _latest_cache['name']:
+                    latest_name = _latest_cache['name']
+                    latest_time = _latest_cache['ctime']
+                else:
+                    latest_name, latest_time = _scan_for_latest(image_dir, logger)
+                    _latest_cache['dir_mtime'] = dir_mtime
+                    _latest_cache['name'] = latest_name
+                    _latest_cache['ctime'] = latest_time
+
+            if not latest_name:
                 logger.error(f"No valid images found in {image_dir}")
-                return jsonify({'error': 'No images found'}), 404
-                
-            # Verify file is readable
-            if not os.access(latest_entry.path, os.R_OK):
-                logger.error(f"File not readable: {latest_entry.path}")
-                return jsonify({'error': 'Image file not accessible'}), 403
-                
-            # Get file timestamp
+                return ojson({'error': 'No images found'}, 404)
+
+            # Get file timestamp. Readability is not pre-checked here: the
+            # image itself is served separately, and an unreadable file will
+            # surface as an error on that request instead of costing an
+            # extra stat on every poll.
             timestamp = latest_time
-        
+
             # Force fresh read of camera profiles
             camera_profiles = config.get_config('camera_profiles')
 
@@ -72,16 +101,34 @@ def register_image_routes(app: Flask):
             current_settings = camera_profiles[current_profile]
             
             response_data = {
-                'path': f'/images/{latest_entry.name}',
+                'path': f'/images/{latest_name}',
                 'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+                # Epoch seconds so clients can send If-Modified-Since when
+                # fetching the image itself and get a bodyless 304 back
+                'last_modified': int(timestamp),
                 'sun_phase': camera_settings.get_sun_phase(),
                 'camera_profile': current_profile,
                 'camera_settings': current_settings
             }
             
-            logger.debug(f"Returning response: {response_data}")
-            return jsonify(response_data), 200
+            logger.debug("Returning response: %s", response_data)
+            return ojson(response_data, 200)
             
         except Exception as e:
             logger.exception("Error in get_latest_image")
-            return jsonify({'error': str(e)}), 500
+            return ojson({'error': str(e)}, 500)
+
+    @app.route('/images/<path:name>', methods=['GET', 'HEAD'])
+    def serve_image(name: str) -> Response:
+        """Serve a captured image with conditional-GET and Range support
+
+        conditional=True makes Flask emit ETag/Last-Modified headers,
+        answer If-None-Match / If-Modified-Since polls with a bodyless
+        304, and honor Range requests with 206 Partial Content -- so a
+        client that only needs the JPEG header (dimensions, progressive
+        preview) can fetch the first few KB instead of the whole file.
+        """
+        response = send_from_directory(config.get_image_dir(), name, conditional=True)
+        # Advertise range support explicitly, including on HEAD probes
+        response.headers.setdefault('Accept-Ranges', 'bytes')
+        return response
@@ -1,10 +1,24 @@
+from functools import lru_cache
+
 from .camera_settings import CameraSettings
 from .camera_controller import CameraController
 from .image_processor import ImageProcessor, BasicProcessor
 from .capture_service import ImageCaptureService
 
+@lru_cache(maxsize=1)
+def get_shared_settings() -> CameraSettings:
+    """
+    Get the shared CameraSettings instance for the API layer
+
+    Built lazily so importing a route module doesn't read config files or
+    log during worker warm-up; the first request pays the cost instead,
+    and every handler after that reuses the same instance.
+    """
+    return CameraSettings()
+
 __all__ = [
     'CameraSettings',
+    'get_shared_settings',
     'CameraController',
     'ImageProcessor',
     'BasicProcessor',
@@ -6,7 +6,16 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 
 from .camera_settings import CameraSettings
-from .image_processor import BasicProcessor
+
+# picamera2 ships with Raspberry Pi OS rather than pip; fall back to
+# shelling out to libcamera-still when it isn't available
+try:
+    from picamera2 import Picamera2
+except ImportError:
+    Picamera2 = None
+
+# Fixed portion of the libcamera-still invocation, shared by every capture
+_LIBCAMERA_ARGS = ("--width", "4056", "--height", "3040")
 
 class CameraController:
     """
@@ -28,16 +37,75 @@ class CameraController:
         self.image_dir = image_dir
         self.logger = logger or logging.getLogger("CAMERA")
         self.settings = CameraSettings(logger=self.logger)
-        self.processor = BasicProcessor(logger=self.logger)
+        # No image processor is wired in by default; BasicProcessor is a
+        # documented no-op, so captures skip the call until a real
+        # implementation (e.g. dark frame subtraction) exists
+        self.processor = None
         self.last_capture_time = 0
         self.capture_interval = 60  # seconds
 
+        # Persistent picamera2 pipeline, created lazily on first capture.
+        # Holding the pipeline open between shots avoids the multi-second
+        # sensor/ISP re-initialization every libcamera-still fork pays.
+        self._picam2 = None
+        self._picam2_failed = False
+
     def ensure_directory_exists(self):
         """Ensure that the image directory exists"""
         if not os.path.exists(self.image_dir):
             os.makedirs(self.image_dir)
             self.logger.info(f"Created directory: {self.image_dir}")
 
+    def _get_picamera(self) -> Optional["Picamera2"]:
+        """
+        Get the persistent picamera2 pipeline, starting it on first use
+
+        Returns:
+            Optional[Picamera2]: Started pipeline, or None if picamera2 is
+            unavailable (captures then fall back to libcamera-still)
+        """
+        if Picamera2 is None or self._picam2_failed:
+            return None
+
+        if self._picam2 is None:
+            try:
+                picam2 = Picamera2()
+                still_config = picam2.create_still_configuration(
+                    main={"size": (4056, 3040)}
+                )
+                picam2.configure(still_config)
+                picam2.start()
+                self._picam2 = picam2
+                self.logger.info("Started persistent picamera2 pipeline")
+            except Exception as e:
+                # Don't retry every capture if the pipeline can't start
+                self._picam2_failed = True
+                self.logger.error(f"Failed to start picamera2 pipeline, "
+                                  f"falling back to libcamera-still: {e}")
+                return None
+
+        return self._picam2
+
+    def _apply_picamera_controls(self, picam2: "Picamera2", settings: Dict[str, Any]) -> None:
+        """
+        Translate a camera profile into picamera2 controls
+
+        Args:
+            picam2: The running pipeline
+            settings: Camera settings to apply
+        """
+        controls = {}
+        if settings["shutter_speed"] > 0:
+            controls["ExposureTime"] = int(settings["shutter_speed"])
+        if settings["gain"] > 0:
+            controls["AnalogueGain"] = float(settings["gain"])
+        if settings["brightness"] is not None:  # Allow 0 as valid value
+            controls["Brightness"] = float(settings["brightness"])
+        if settings["contrast"] > 0:  # Since contrast 0 makes no sense
+            controls["Contrast"] = float(settings["contrast"])
+
+        picam2.set_controls(controls)
+
     def build_libcamera_command(self, filepath: str, settings: Dict[str, Any]) -> List[str]:
         """
         Build the libcamera command with all relevant parameters
@@ -49,22 +117,17 @@ class CameraController:
         Returns:
             List[str]: Command list for subprocess execution
         """
-        cmd = [
-            "libcamera-still",
-            "-o", filepath,
-            "--width", "4056",
-            "--height", "3040"
-        ]
-        
+        cmd = ["libcamera-still", "-o", filepath, *_LIBCAMERA_ARGS]
+
         if settings["shutter_speed"] > 0:
-            cmd.extend(["--shutter", str(settings["shutter_speed"])])
+            cmd.extend(("--shutter", str(settings["shutter_speed"])))
         if settings["gain"] > 0:
-            cmd.extend(["--gain", str(settings["gain"])])
+            cmd.extend(("--gain", str(settings["gain"])))
         if settings["brightness"] is not None:  # Allow 0 as valid value
-            cmd.extend(["--brightness", str(settings["brightness"])])
+            cmd.extend(("--brightness", str(settings["brightness"])))
         if settings["contrast"] > 0:  # Since contrast 0 makes no sense
-            cmd.extend(["--contrast", str(settings["contrast"])])
-    
+            cmd.extend(("--contrast", str(settings["contrast"])))
+
         return cmd
 
     def capture_image(self) -> Optional[str]:
@@ -75,46 +138,50 @@ class CameraController:
             Optional[str]: Path to the captured image, or None if capture failed
         """
         try:
-            # Log start of capture process
-            self.logger.info("=" * 50)
-            self.logger.info("Starting new image capture")
-
             # Force update of camera profile and settings before capture
             self.settings.update_profile_from_sun_phase()
-            
-            # Get current settings and log them
+
+            # Get current settings; one record instead of a banner plus
+            # one line per setting
             current_settings = self.settings.get_current_settings()
-            self.logger.info("Current camera settings:")
-            for setting, value in current_settings.items():
-                self.logger.info(f"  {setting}: {value}")
-            
+            self.logger.info("Starting new image capture with settings: %s",
+                             current_settings)
+
             # Create filename and build command
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"image_{timestamp}.jpg"
             filepath = os.path.join(self.image_dir, filename)
             
-            # Build and log command
-            cmd = self.build_libcamera_command(filepath, current_settings)
-            cmd_str = " ".join(cmd)
-            self.logger.info(f"Executing libcamera command: {cmd_str}")
-            
-            # Execute capture with timing
+            # Capture through the persistent pipeline when available,
+            # otherwise fork libcamera-still as before
+            picam2 = self._get_picamera()
             start_time = time.time()
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+
+            if picam2 is not None:
+                self._apply_picamera_controls(picam2, current_settings)
+                picam2.capture_file(filepath)
+            else:
+                cmd = self.build_libcamera_command(filepath, current_settings)
+                cmd_str = " ".join(cmd)
+                self.logger.info("Executing libcamera command: %s", cmd_str)
+
+                result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+                if result.stdout:
+                    self.logger.info("libcamera output: %s", result.stdout)
+
             capture_duration = time.time() - start_time
-            
+
             # Log capture results
-            self.logger.info(f"Image captured successfully: {filename}")
-            self.logger.info(f"Capture duration: {capture_duration:.2f} seconds")
-            
-            if result.stdout:
-                self.logger.info(f"libcamera output: {result.stdout}")
-            
-            # Process image
-            processed_path = self.processor.process(filepath)
-            self.logger.info(f"Image processing complete: {processed_path}")
-            self.logger.info("=" * 50)
-            
+            self.logger.info("Image captured successfully: %s", filename)
+            self.logger.info("Capture duration: %.2f seconds", capture_duration)
+
+            # Process image if a processor is configured
+            if self.processor is not None:
+                processed_path = self.processor.process(filepath)
+                self.logger.info("Image processing complete: %s", processed_path)
+            else:
+                processed_path = filepath
+
             return processed_path
             
         except subprocess.CalledProcessError as e:
@@ -122,10 +189,8 @@ class CameraController:
             if e.stderr:
                 self.logger.error(f"libcamera error output: {e.stderr}")
             return None
-        except Exception as e:
-            self.logger.error(f"Unexpected error during capture: {e}")
-            import traceback
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            self.logger.exception("Unexpected error during capture")
             return None
 
     def update_settings(self, new_settings: Dict[str, Any]) -> None:
@@ -1,13 +1,25 @@
 import math
+import time
 import logging
+import threading
+from bisect import bisect_left
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import suncalc
 from typing import Dict, Any, Optional
 
 # Import the config singleton
 from src.config import config
 
+# Constructed once: building a timezone per call is surprisingly expensive
+_LOCAL_TZ = ZoneInfo('America/Chicago')
+
+# Sun altitude thresholds (degrees) and the phase bucket each one bounds;
+# bisect_left on the thresholds maps an altitude straight to its phase
+_PHASE_THRESHOLDS = (-18.0, -12.0, -6.0, -0.833)
+_PHASE_NAMES = ("night", "astronomical_twilight", "nautical_twilight",
+                "civil_twilight", "day")
+
 class CameraSettings:
     """
     Manages camera settings and profiles based on sun position
@@ -17,10 +29,19 @@ class CameraSettings:
     - Calculating sun position to determine appropriate profile
     - Updating geographic coordinates
     """
+    # How long a computed sun phase stays valid. Sun altitude changes by
+    # roughly 0.25 degrees per minute, far less than the width of any
+    # phase bucket, so a 60 second cache never returns a stale phase.
+    PHASE_CACHE_SECONDS = 60
+
     def __init__(self, logger=None):
         self.current_profile = "default"
         self.logger = logger or logging.getLogger("CAMERA")
-        
+        self._phase_cache = (0.0, None)
+        # The shared instance is hit from multiple threads under a
+        # threaded WSGI server; guard profile transitions
+        self._profile_lock = threading.Lock()
+
         try:
             self.logger.info("Loading camera profiles from config...")
             self.profiles = config.get_config('camera_profiles')
@@ -46,68 +67,65 @@ class CameraSettings:
             str: The current sun phase (day, civil_twilight, nautical_twilight, 
                  astronomical_twilight, or night)
         """
+        # Return the memoized phase if it is still fresh -- this avoids
+        # the config read and the suncalc trig on every API request
+        cached_at, cached_phase = self._phase_cache
+        if cached_phase is not None and time.monotonic() - cached_at < self.PHASE_CACHE_SECONDS:
+            return cached_phase
+
         try:
             # Get current coordinates from config - reload to ensure fresh values
             latest_coords = config.get_config('coordinates')
-            self.logger.info(f"Reloaded coordinates for phase calculation: {latest_coords}")
-            
+            self.logger.debug("Reloaded coordinates for phase calculation: %s", latest_coords)
+
             latitude = latest_coords['latitude']
             longitude = latest_coords['longitude']
-            
+
             # Create timezone-aware datetime
-            local_tz = pytz.timezone('America/Chicago')
-            now = datetime.now(local_tz)
-            self.logger.info(f"Calculating sun position for time: {now}")
-            
+            now = datetime.now(_LOCAL_TZ)
+            self.logger.debug("Calculating sun position for time: %s", now)
+
             position = suncalc.get_position(now, longitude, latitude)
             altitude = math.degrees(position['altitude'])
-            
-            self.logger.info(f"Raw sun position data: {position}")
-            self.logger.info(f"Calculated altitude: {altitude}°")
-            
-            # Detailed phase determination with logging
-            phase = None
-            if altitude <= -18:
-                phase = "night"
-                self.logger.info(f"altitude {altitude}° <= -18° -> night")
-            elif altitude <= -12:
-                phase = "astronomical_twilight"
-                self.logger.info(f"-18° < altitude {altitude}° <= -12° -> astronomical_twilight")
-            elif altitude <= -6:
-                phase = "nautical_twilight"
-                self.logger.info(f"-12° < altitude {altitude}° <= -6° -> nautical_twilight")
-            elif altitude <= -0.833:
-                phase = "civil_twilight"
-                self.logger.info(f"-6° < altitude {altitude}° <= -0.833° -> civil_twilight")
-            else:
-                phase = "day"
-                self.logger.info(f"altitude {altitude}° > -0.833° -> day")
-                
-            self.logger.info(f"Final determined phase: {phase}")
+
+            # Map altitude to its phase bucket (thresholds are inclusive upper
+            # bounds, matching the previous altitude <= threshold chain)
+            phase = _PHASE_NAMES[bisect_left(_PHASE_THRESHOLDS, altitude)]
+
+            self.logger.debug("Altitude %s° -> phase: %s", altitude, phase)
+            self._phase_cache = (time.monotonic(), phase)
             return phase
-                
-        except Exception as e:
-            self.logger.error(f"Error calculating sun phase: {e}")
-            import traceback
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+
+        except Exception:
+            self.logger.exception("Error calculating sun phase")
             return "day"  # Default to day mode if calculation fails
         
     def update_profile_from_sun_phase(self) -> None:
         """Update the current profile based on sun phase"""
-        old_profile = self.current_profile
         phase = self.get_sun_phase()
-        if phase in self.profiles:
-            self.current_profile = phase
-            if old_profile != self.current_profile:
-                self.logger.info(f"Profile changed: {old_profile} -> {self.current_profile}")
-                self.logger.info(f"New settings: {self.profiles[self.current_profile]}")
-        else:
-            self.logger.warning(f"No profile found for phase {phase}, keeping current profile: {self.current_profile}")
+        with self._profile_lock:
+            old_profile = self.current_profile
+            if phase in self.profiles:
+                self.current_profile = phase
+                if old_profile != self.current_profile:
+                    self.logger.info("Profile changed: %s -> %s", old_profile, self.current_profile)
+                    self.logger.info("New settings: %s", self.profiles[self.current_profile])
+            else:
+                self.logger.warning("No profile found for phase %s, keeping current profile: %s", phase, self.current_profile)
+
+    def refresh(self) -> None:
+        """Reload profiles and coordinates from config
+
+        Call this when the config files are known to have changed;
+        get_current_settings no longer reloads on every call.
+        """
+        self.profiles = config.get_config('camera_profiles')
+        self.coordinates = config.get_config('coordinates')
+        # Invalidate the memoized phase so the next call uses fresh coordinates
+        self._phase_cache = (0.0, None)
 
     def get_current_settings(self) -> Dict[str, Any]:
         """Get current camera settings"""
-        # Reload profiles from config to ensure we have the latest
-        self.profiles = config.get_config('camera_profiles')
         return self.profiles[self.current_profile].copy()
 
     def update_profile(self, profile_name: str, settings: Dict[str, Any]) -> None:
@@ -16,6 +16,11 @@ class ImageCaptureService:
     - Runs a continuous loop to capture images at regular intervals
     - Manages error handling and logging
     """
+    # Run disk cleanup every N successful captures instead of every one;
+    # a capture is a few MB, so the limit can't be meaningfully overshot
+    # between checks
+    CLEANUP_EVERY_N_CAPTURES = 10
+
     def __init__(self, logger=None):
         """
         Initialize the image capture service
@@ -45,6 +50,7 @@ class ImageCaptureService:
         # Initialize camera controller
         self.camera = CameraController(self.image_dir, logger=self.logger)
         self.running = False
+        self._cleanup_counter = 0
         
         # Set initial capture interval
         capture_interval = self.system_settings.get('capture_interval', 60)
@@ -59,11 +65,18 @@ class ImageCaptureService:
         # Import and initialize disk manager 
         from src.utils.disk_manager import DiskSpaceManager
         max_disk_usage = self.system_settings.get('max_disk_usage_gb', 20)
-        self.disk_manager = DiskSpaceManager(self.image_dir, max_disk_usage, self.logger)
+        self.disk_manager = DiskSpaceManager(
+            self.image_dir, max_disk_usage, self.logger,
+            own_partition=self.system_settings.get('images_on_own_partition', False))
         self.logger.info(f"Disk manager initialized with max usage: {max_disk_usage} GB")
         
         self.logger.info("Starting image capture service")
-        
+
+        # Schedule captures against absolute deadlines so the cadence is
+        # exactly capture_interval rather than interval + capture duration,
+        # which would otherwise drift by tens of minutes per day
+        next_tick = time.monotonic()
+
         while self.running:
             try:
                 # Reload system settings to check for changes
@@ -86,18 +99,33 @@ class ImageCaptureService:
                 if captured_image:
                     self.logger.info(f"Successfully captured image: {captured_image}")
                     self.logger.info(f"Current profile: {self.camera.settings.current_profile}")
-                    
-                    # Run disk space cleanup after successful capture
+
+                    # Tell the disk manager what was just written so its
+                    # usage checks can stay off the filesystem
                     if self.disk_manager:
+                        try:
+                            self.disk_manager.note_added(os.path.getsize(captured_image))
+                        except OSError:
+                            pass
+
+                    # Run disk space cleanup periodically rather than
+                    # walking the image directory after every capture
+                    self._cleanup_counter += 1
+                    if self.disk_manager and self._cleanup_counter % self.CLEANUP_EVERY_N_CAPTURES == 0:
                         self.disk_manager.cleanup_if_needed()
                 
-                # Wait until next capture
-                time.sleep(self.camera.capture_interval)
-                
-            except Exception as e:
-                self.logger.error(f"Error in capture loop: {e}")
-                import traceback
-                self.logger.error(f"Traceback: {traceback.format_exc()}")
+                # Wait until the next absolute deadline
+                next_tick += self.camera.capture_interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # The capture overran the interval; re-anchor instead of
+                    # firing a burst of back-to-back captures to catch up
+                    next_tick = time.monotonic()
+
+            except Exception:
+                self.logger.exception("Error in capture loop")
                 time.sleep(5)  # Wait before retrying
 
     def stop(self):
@@ -1,27 +1,40 @@
 # src/config/config_manager.py
 import os
+import copy
 import yaml
 import json
+import orjson
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 class ConfigManager:
     """
     Centralized configuration management for CosmiCam
-    
+
     """
     _instance = None
-    
+    _lock = threading.Lock()
+
     def __new__(cls):
+        # Double-checked locking: the fast path is a plain attribute read,
+        # and the instance is only published once fully initialized so a
+        # concurrent constructor can never see a half-built singleton
         if cls._instance is None:
-            cls._instance = super(ConfigManager, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(ConfigManager, cls).__new__(cls)
+                    instance._initialize()
+                    cls._instance = instance
         return cls._instance
-    
+
     def __init__(self):
-        if hasattr(self, 'initialized'):
-            return
-            
+        # Initialization happens exactly once in __new__
+        pass
+
+    def _initialize(self):
+        """One-time setup of paths, defaults, and config files"""
         # Base directory paths
         self.app_root = os.environ.get('COSMICAM_ROOT', os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
         
@@ -76,10 +89,17 @@ class ConfigManager:
             'system_settings': {
                 'capture_interval': 60,
                 'max_disk_usage_gb': 20,
+                # Set True when the image directory has a filesystem to
+                # itself; usage checks then cost one statvfs call
+                'images_on_own_partition': False,
                 'fan_control': {
                     'log_interval': 300,
                     'min_temp': 40,
-                    'max_temp': 80
+                    'max_temp': 80,
+                    # [temp, duty] pairs; each duty applies from its
+                    # temperature up to the next point
+                    'curve': [[0, 10], [40, 20], [45, 30],
+                              [50, 50], [55, 70], [60, 100]]
                 }
             }
         }
@@ -107,10 +127,15 @@ class ConfigManager:
             'system_settings': os.path.join(self.config_dir, 'system_settings.json')
         }
         
-        # Initialize configuration files if they don't exist
-        self._init_config_files()
-        
-        self.initialized = True
+        # Parsed-config cache keyed on file mtime, so repeat get_config
+        # calls cost a stat instead of an open+read+parse cycle
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache_mtime: Dict[str, int] = {}
+
+        # Config files are created/validated lazily on first access so
+        # importing this module doesn't stat or parse anything for
+        # scripts that never read config
+        self._files_initialized = False
 
     def _setup_logging(self) -> None:
         """Configure basic logging for the configuration manager"""
@@ -126,6 +151,14 @@ class ConfigManager:
         )
         self.logger = logging.getLogger("CONFIG")
 
+    def _ensure_config_files(self) -> None:
+        """Run one-time config file initialization on first access"""
+        if not self._files_initialized:
+            with self._lock:
+                if not self._files_initialized:
+                    self._init_config_files()
+                    self._files_initialized = True
+
     def _init_config_files(self) -> None:
         """Initialize configuration files with default values if they don't exist"""
         for config_name, filepath in self.config_files.items():
@@ -164,6 +197,44 @@ class ConfigManager:
                     with open(filepath, 'w') as f:
                         yaml.dump(self.defaults[config_name], f, default_flow_style=False)
     
+    def _load_config_file(self, yaml_path: str, mtime: int) -> Dict[str, Any]:
+        """
+        Load a config file, preferring its compiled binary cache
+
+        YAML stays the human-editable source of truth, but PyYAML parsing
+        dominates cold-start config load. A .cache file holding the
+        orjson-serialized data plus the source mtime sits next to each
+        YAML file; when the mtimes match, loading it skips the YAML parse
+        entirely. The cache is rewritten whenever the YAML changes.
+
+        Args:
+            yaml_path: Path to the YAML source file
+            mtime: The YAML file's current st_mtime_ns
+
+        Returns:
+            Dict containing the configuration data
+        """
+        cache_path = yaml_path + '.cache'
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = orjson.loads(f.read())
+            if cached.get('mtime') == mtime:
+                return cached['data']
+        except (OSError, ValueError):
+            pass
+
+        with open(yaml_path, 'r') as f:
+            data = yaml.safe_load(f)
+
+        try:
+            with open(cache_path, 'wb') as f:
+                f.write(orjson.dumps({'mtime': mtime, 'data': data}))
+        except (OSError, TypeError) as e:
+            # The cache is an optimization; never fail the load over it
+            self.logger.warning(f"Could not write config cache {cache_path}: {e}")
+
+        return data
+
     def get_config(self, config_name: str) -> Dict[str, Any]:
         """
         Read configuration from specified config file
@@ -179,20 +250,28 @@ class ConfigManager:
         """
         if config_name not in self.config_files:
             raise ValueError(f"Unknown configuration: {config_name}")
-            
+
+        self._ensure_config_files()
+
         try:
             # Try loading YAML first
             yaml_path = self.config_files[config_name]
             if os.path.exists(yaml_path):
-                with open(yaml_path, 'r') as f:
-                    return yaml.safe_load(f)
-            
+                # Serve from cache while the file is unchanged; the mtime
+                # check is a single stat vs a full open+read+parse
+                mtime = os.stat(yaml_path).st_mtime_ns
+                if self._cache_mtime.get(config_name) != mtime:
+                    self._cache[config_name] = self._load_config_file(yaml_path, mtime)
+                    self._cache_mtime[config_name] = mtime
+                # Return a copy so callers can mutate without corrupting the cache
+                return copy.deepcopy(self._cache[config_name])
+
             # Fall back to JSON if it exists
             json_path = self.json_fallbacks[config_name]
             if os.path.exists(json_path):
                 with open(json_path, 'r') as f:
                     return json.load(f)
-                    
+
         except Exception as e:
             self.logger.error(f"Error reading {config_name} configuration: {e}")
             
@@ -216,7 +295,9 @@ class ConfigManager:
         """
         if config_name not in self.config_files:
             raise ValueError(f"Unknown configuration: {config_name}")
-            
+
+        self._ensure_config_files()
+
         try:
             filepath = self.config_files[config_name]
             
@@ -229,7 +310,13 @@ class ConfigManager:
             # Write back to YAML file
             with open(filepath, 'w') as f:
                 yaml.dump(current_config, f, default_flow_style=False)
-            
+
+            # Write through to the cache so readers see the new data
+            # without waiting on an mtime mismatch (filesystem mtime
+            # granularity can miss rapid successive updates)
+            self._cache[config_name] = copy.deepcopy(current_config)
+            self._cache_mtime[config_name] = os.stat(filepath).st_mtime_ns
+
             self.logger.info(f"Updated {config_name} configuration")
             return True
         except Exception as e:
@@ -1,35 +1,148 @@
 import os
 import sys
+import signal
 import gpiod
-import RPi.GPIO as GPIO
+from gpiod.line import Bias, Direction, Edge, Value
 import time
 import threading
 import subprocess
 import logging
-from datetime import datetime
+from bisect import bisect_right
+from functools import lru_cache
 
 from src.config import config
 from src.utils import setup_logger
 
+def _detect_gpio_chip():
+    """Pick the GPIO chip for the 40-pin header from the board model
+
+    The header lines live on gpiochip4 on the Pi 5 (BCM2712) but on
+    gpiochip0 on earlier boards, so a hardcoded name breaks on one
+    generation or the other.
+    """
+    try:
+        with open('/proc/device-tree/model') as f:
+            model = f.read()
+    except OSError:
+        model = ''
+    return 'gpiochip4' if 'Raspberry Pi 5' in model else 'gpiochip0'
+
 # Configuration
-CHIP_NAME = "gpiochip0"  # Change to your specific chip
+CHIP_NAME = _detect_gpio_chip()
 PWM_LINE = 13  # GPIO13 for PWM control
 TACH_PIN = 6   # GPIO6 for tach reading
 PWM_FREQUENCY = 10000  # 10 kHz
 TEMPERATURE_CHECK_INTERVAL = 60  # seconds
 TACH_CHECK_INTERVAL = 900  # 15 minutes in seconds
 
-# Set GPIO mode for tachometer reading - only set mode once
-GPIO.setwarnings(False)  # Disable warnings that might occur when re-initializing pins
-GPIO.setmode(GPIO.BCM)   # Use BCM pin numbering
+# Fallback fan curve as [temp, duty] pairs: each duty applies from its
+# temperature upward. Used when system_settings has no 'curve' entry.
+DEFAULT_FAN_CURVE = [[0, 10], [40, 20], [45, 30], [50, 50], [55, 70], [60, 100]]
+
+@lru_cache(maxsize=1)
+def _get_fan_settings():
+    """Fan settings sub-dict, read once per process
+
+    Deferred to first use rather than import time so importing the
+    module never touches the config files.
+    """
+    return config.get_config('system_settings')['fan_control']
+
+class HardwarePWMController:
+    """Hardware PWM via the kernel sysfs interface
+
+    GPIO13 is channel 1 of the Pi's PWM peripheral. Driving it through
+    /sys/class/pwm gives clock-accurate, jitter-free edges with no Python
+    thread at all -- the software fallback below burns a core toggling
+    the line 20 000 times a second. Requires the PWM overlay
+    (dtoverlay=pwm-2chan) to be enabled in config.txt.
+    """
+
+    PWM_CHIP_PATH = "/sys/class/pwm/pwmchip0"
+    PWM_CHANNEL = 1  # GPIO13
+
+    def __init__(self, frequency=PWM_FREQUENCY, logger=None):
+        """
+        Initialize the hardware PWM channel
+
+        Args:
+            frequency: PWM frequency in Hz
+            logger: Logger instance
+
+        Raises:
+            OSError: If the sysfs PWM interface is unavailable
+        """
+        self.logger = logger or logging.getLogger("FAN")
+        self.frequency = frequency
+        self.period_ns = int(1_000_000_000 / frequency)
+        self.duty_cycle = 0
+        self._channel_path = os.path.join(self.PWM_CHIP_PATH, f"pwm{self.PWM_CHANNEL}")
+
+        # Export the channel if the kernel hasn't already
+        if not os.path.isdir(self._channel_path):
+            self._write_chip("export", self.PWM_CHANNEL)
+
+        self._write("period", self.period_ns)
+        self._write("duty_cycle", 0)
+
+    def _write_chip(self, name, value):
+        with open(os.path.join(self.PWM_CHIP_PATH, name), "w") as f:
+            f.write(str(value))
+
+    def _write(self, name, value):
+        with open(os.path.join(self._channel_path, name), "w") as f:
+            f.write(str(value))
+
+    def start(self):
+        """Enable the PWM output"""
+        self._write("enable", 1)
+        self.logger.info(f"Started hardware PWM on channel {self.PWM_CHANNEL} at {self.frequency} Hz")
+
+    def stop(self):
+        """Disable the PWM output
+
+        The duty register is deliberately left at its last value so a
+        later re-enable (or an operator poking sysfs) resumes at a
+        known speed instead of zero.
+        """
+        try:
+            self._write("enable", 0)
+        except OSError as e:
+            self.logger.error(f"Error stopping hardware PWM: {e}")
+        self.logger.info(f"Stopped hardware PWM on channel {self.PWM_CHANNEL}")
+
+    def park(self):
+        """Leave the output enabled at full duty
+
+        Shutdown failsafe: the PWM peripheral keeps generating the
+        waveform after the process exits, so the fan runs at full
+        speed instead of sitting stopped under a live SoC.
+        """
+        try:
+            self.set_duty_cycle(100)
+        except OSError as e:
+            self.logger.error(f"Error parking hardware PWM: {e}")
+        self.logger.info(f"Parked hardware PWM on channel {self.PWM_CHANNEL} at full speed")
+
+    def set_duty_cycle(self, duty_cycle):
+        """Set the duty cycle (0-100)"""
+        self.duty_cycle = max(0, min(100, duty_cycle))
+        self._write("duty_cycle", int(self.period_ns * self.duty_cycle / 100))
 
 class PWMController:
-    """Software PWM implementation for Raspberry Pi using RPi.GPIO"""
-    
+    """Software PWM implementation using a gpiod output line
+
+    Fallback for systems where the sysfs PWM interface is unavailable;
+    prefer HardwarePWMController, which needs no thread. The line is
+    requested from the kernel once at construction, so each edge is a
+    single set_value on the held request rather than RPi.GPIO's
+    per-call pin bookkeeping.
+    """
+
     def __init__(self, pin, frequency=PWM_FREQUENCY, logger=None):
         """
-        Initialize a software PWM controller using RPi.GPIO
-        
+        Initialize a software PWM controller on a gpiod line
+
         Args:
             pin: GPIO pin number to control
             frequency: PWM frequency in Hz
@@ -41,13 +154,25 @@ class PWMController:
         self.running = False
         self.thread = None
         self.logger = logger or logging.getLogger("FAN")
-        
-        # Configure GPIO pin as output
-        GPIO.setup(self.pin, GPIO.OUT)
-        GPIO.output(self.pin, GPIO.LOW)
-        
-        # Calculate period in seconds
-        self.period = 1 / frequency
+
+        # Request the line as an output once, driven low
+        self._request = gpiod.request_lines(
+            f"/dev/{CHIP_NAME}",
+            consumer="cosmicam-pwm",
+            config={
+                pin: gpiod.LineSettings(
+                    direction=Direction.OUTPUT,
+                    output_value=Value.INACTIVE,
+                )
+            },
+        )
+
+        # Integer half-period lengths, precomputed by set_duty_cycle so
+        # the hot loop does no arithmetic beyond deadline bookkeeping
+        self.period_ns = int(1_000_000_000 / frequency)
+        self._duty_lock = threading.Lock()
+        self._high_ns = 0
+        self._low_ns = self.period_ns
 
     def start(self):
         """Start the PWM controller"""
@@ -62,34 +187,82 @@ class PWMController:
         self.running = False
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=1.0)
-        GPIO.output(self.pin, GPIO.LOW)  # Ensure pin is low on stop
+        try:
+            self._request.set_value(self.pin, Value.INACTIVE)  # Ensure pin is low on stop
+            self._request.release()
+        except Exception as e:
+            self.logger.error(f"Error releasing PWM line: {e}")
         self.logger.info(f"Stopped software PWM on pin {self.pin}")
 
+    def park(self):
+        """Stop the PWM thread and release the line without driving it low
+
+        Shutdown failsafe: standard 4-wire fans run full speed when the
+        control line floats, so releasing the line (rather than forcing
+        it low as stop() does) leaves the fan on if the process dies
+        before the next service start.
+        """
+        self.running = False
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=1.0)
+        try:
+            self._request.release()
+        except Exception as e:
+            self.logger.error(f"Error releasing PWM line: {e}")
+        self.logger.info(f"Parked software PWM on pin {self.pin}; line released to float high")
+
     def set_duty_cycle(self, duty_cycle):
         """Set the duty cycle (0-100)"""
         self.duty_cycle = max(0, min(100, duty_cycle))
+        with self._duty_lock:
+            self._high_ns = self.period_ns * self.duty_cycle // 100
+            self._low_ns = self.period_ns - self._high_ns
+
+    @staticmethod
+    def _sleep_until(deadline_ns):
+        """Sleep to an absolute monotonic deadline"""
+        delta = deadline_ns - time.monotonic_ns()
+        if delta > 0:
+            time.sleep(delta / 1_000_000_000)
 
     def _pwm_loop(self):
         """PWM control loop"""
+        # Ask for real-time scheduling: the bit-banged waveform is ruined
+        # by ordinary preemption, which shows up as audible fan whine.
+        # Needs CAP_SYS_NICE, so fall back silently to normal scheduling.
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+            self.logger.info("Software PWM thread running with SCHED_FIFO priority")
+        except (OSError, PermissionError):
+            self.logger.warning("Could not set SCHED_FIFO for PWM thread "
+                                "(needs CAP_SYS_NICE); expect some jitter")
+
+        # Absolute deadlines: each edge is scheduled period-on-period
+        # from the previous one, so per-sleep overshoot doesn't
+        # accumulate into frequency drift
+        next_edge = time.monotonic_ns()
         while self.running:
             try:
-                if self.duty_cycle == 0:
-                    # Set to low (inactive)
-                    GPIO.output(self.pin, GPIO.LOW)
-                    time.sleep(self.period)
-                elif self.duty_cycle == 100:
-                    # Set to high (active)
-                    GPIO.output(self.pin, GPIO.HIGH)
-                    time.sleep(self.period)
-                else:
-                    # PWM implementation
-                    GPIO.output(self.pin, GPIO.HIGH)
-                    time.sleep(self.period * self.duty_cycle / 100)
-                    GPIO.output(self.pin, GPIO.LOW)
-                    time.sleep(self.period * (100 - self.duty_cycle) / 100)
+                with self._duty_lock:
+                    high_ns, low_ns = self._high_ns, self._low_ns
+
+                if high_ns:
+                    self._request.set_value(self.pin, Value.ACTIVE)
+                    next_edge += high_ns
+                    self._sleep_until(next_edge)
+                if low_ns:
+                    self._request.set_value(self.pin, Value.INACTIVE)
+                    next_edge += low_ns
+                    self._sleep_until(next_edge)
+
+                # Re-anchor if preemption pushed us far behind schedule;
+                # a catch-up burst of edges helps nobody
+                if time.monotonic_ns() - next_edge > 1_000_000_000:
+                    next_edge = time.monotonic_ns()
             except Exception as e:
                 self.logger.error(f"PWM error: {e}")
                 time.sleep(0.1)  # Prevent CPU thrashing on error
+                next_edge = time.monotonic_ns()
 
 class FanController:
     """Controls the cooling fan based on CPU temperature"""
@@ -98,10 +271,36 @@ class FanController:
         """Initialize the fan controller"""
         self.logger = logger or logging.getLogger("FAN")
         self.pwm = None
-        self.running = False
+        # Signalled to stop; loops wait on this instead of time.sleep so
+        # shutdown interrupts an interval wait immediately
+        self._stop_event = threading.Event()
         self.debug_mode = debug_mode
-        self.fan_settings = config.get_config('system_settings')['fan_control']
+        self._tach_request = None
+        self._tach_bias = None  # Resolved once by _calibrate_tach_bias
+        self._last_duty = None  # Last duty written, to skip no-op PWM writes
+        self._drain_thread = None
+
+        # Persistent handle to the thermal zone; each sample is then a
+        # seek+read instead of an open/close pair
+        try:
+            self._temp_fd = open('/sys/class/thermal/thermal_zone0/temp')
+        except OSError:
+            self._temp_fd = None
+
+        # Rolling tach state: a background drain loop accumulates kernel
+        # edge events into _pulse_count, and read_tach computes RPM from
+        # the delta since its last snapshot instead of blocking for a
+        # fixed measurement window
+        self._tach_lock = threading.Lock()
+        self._pulse_count = 0
+        self._last_tach_snapshot = (0, time.monotonic())
+        self.fan_settings = _get_fan_settings()
         self.logger.info(f"Fan controller initialized with settings: {self.fan_settings}")
+
+        # Fan curve comes from config so thresholds are editable without
+        # a code change; sorted once here for the bisect lookup
+        curve = self.fan_settings.get('curve') or DEFAULT_FAN_CURVE
+        self._curve_temps, self._curve_duties = zip(*sorted(curve))
         
         # Set up debug logging if requested
         if self.debug_mode:
@@ -109,7 +308,20 @@ class FanController:
             self.logger.debug("Debug mode enabled")
         
     def get_cpu_temperature(self):
-        """Get CPU temperature using vcgencmd"""
+        """Get CPU temperature from sysfs
+
+        Reading /sys/class/thermal avoids the fork+exec of vcgencmd,
+        which cost milliseconds per sample; the sysfs value is the same
+        sensor in integer millidegrees. vcgencmd remains as a fallback
+        for systems without the thermal zone.
+        """
+        if self._temp_fd is not None:
+            try:
+                self._temp_fd.seek(0)
+                return int(self._temp_fd.read()) / 1000.0
+            except (OSError, ValueError):
+                pass
+
         try:
             output = subprocess.check_output(['vcgencmd', 'measure_temp']).decode()
             temp = float(output.split('=')[1].split("'")[0])
@@ -119,243 +331,263 @@ class FanController:
             return None
 
     def get_duty_cycle(self, temp):
-        """Calculate duty cycle based on temperature"""
+        """Look up the duty cycle for a temperature on the configured curve"""
         if temp is None:
             return 50  # Default to 50% if temperature reading fails
-        elif temp < 40:
-            return 10
-        elif temp < 45:
-            return 20
-        elif temp < 50:
-            return 30
-        elif temp < 55:
-            return 50
-        elif temp < 60:
-            return 70
-        else:
-            return 100
+        # Each curve point applies from its temperature up to the next one
+        return self._curve_duties[max(0, bisect_right(self._curve_temps, temp) - 1)]
 
-    def read_tach(self, duration=2):
-        """
-        Read tachometer pulses to calculate fan RPM using a direct polling approach
-        
-        This method works by directly measuring the time between tach pulses
-        rather than trying to count them over a fixed time window.
+    # Seconds between batched event drains; the kernel buffers edges in
+    # between, so sizing the buffer for the fastest plausible fan
+    # (~10k RPM -> ~350 edges/s) leaves ample headroom
+    TACH_DRAIN_INTERVAL = 1
+    TACH_EVENT_BUFFER = 4096
+
+    def _calibrate_tach_bias(self):
+        """Probe each line bias briefly and keep the one that sees pulses
+
+        Runs once at startup: boards differ in whether the tach signal
+        needs a pull-up or pull-down, and probing here means read_tach
+        never has to re-try biases on a zero reading. A genuinely
+        stopped fan shows pulses on neither probe and keeps the
+        pull-up default.
         """
+        for bias in (Bias.PULL_UP, Bias.PULL_DOWN):
+            request = gpiod.request_lines(
+                f"/dev/{CHIP_NAME}",
+                consumer="cosmicam-tach-probe",
+                config={
+                    TACH_PIN: gpiod.LineSettings(
+                        edge_detection=Edge.RISING,
+                        bias=bias,
+                    )
+                },
+            )
+            try:
+                if request.wait_edge_events(0.2):
+                    self.logger.debug("Tach bias calibrated to %s", bias)
+                    return bias
+            finally:
+                request.release()
+        return Bias.PULL_UP
+
+    def _ensure_tach_line(self):
+        """Request the tach line for kernel edge detection, once"""
+        if self._tach_request is None:
+            if self._tach_bias is None:
+                self._tach_bias = self._calibrate_tach_bias()
+            self._tach_request = gpiod.request_lines(
+                f"/dev/{CHIP_NAME}",
+                consumer="cosmicam-tach",
+                config={
+                    TACH_PIN: gpiod.LineSettings(
+                        edge_detection=Edge.RISING,
+                        bias=self._tach_bias,
+                    )
+                },
+                event_buffer_size=self.TACH_EVENT_BUFFER,
+            )
+        return self._tach_request
+
+    def _tach_drain_loop(self):
+        """Continuously drain kernel edge events into the pulse counter"""
         try:
-            # Clean up any existing event detection
+            request = self._ensure_tach_line()
+        except Exception:
+            self.logger.exception("Tach line unavailable, RPM will read 0")
+            return
+
+        while not self._stop_event.is_set():
             try:
-                GPIO.remove_event_detect(TACH_PIN)
-            except:
-                pass
-                
-            # Configure tach pin - try both pull-up and pull-down
-            # Some fans need pull-up and others need pull-down
-            GPIO.setup(TACH_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-            
-            # Wait for pin to stabilize
-            time.sleep(0.01)
-            
-            # Debug: Check initial state
-            initial_state = GPIO.input(TACH_PIN)
-            self.logger.debug(f"Tach pin initial state: {initial_state}")
-            
-            # Start time measurement
-            start_time = time.time()
-            pulse_count = 0
-            last_state = initial_state
-            
-            # Use direct polling
-            max_duration = duration  # Maximum time to wait for pulses
-            
-            while time.time() - start_time < max_duration:
-                current_state = GPIO.input(TACH_PIN)
-                
-                # Count rising edges (change from 0 to 1)
-                if current_state == 1 and last_state == 0:
-                    pulse_count += 1
-                    # Log first few pulses for debugging
-                    if pulse_count <= 5:
-                        self.logger.debug(f"Tach pulse detected: {pulse_count}")
-                
-                last_state = current_state
-                # Very short sleep to prevent CPU overuse but still catch fast pulses
-                time.sleep(0.0001)
-            
-            # Calculate elapsed time
-            elapsed_time = time.time() - start_time
-            
-            # Debug info
-            self.logger.debug(f"Tach read: {pulse_count} pulses in {elapsed_time:.2f} seconds")
-            
-            # If no pulses, try again with pull-down resistor
-            if pulse_count == 0 and GPIO.input(TACH_PIN) == initial_state:
-                self.logger.debug("No pulses detected with pull-up, trying pull-down")
-                GPIO.setup(TACH_PIN, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-                time.sleep(0.01)
-                
-                # Try again with pull-down
-                start_time = time.time()
-                last_state = GPIO.input(TACH_PIN)
-                while time.time() - start_time < max_duration / 2:  # Half duration for retry
-                    current_state = GPIO.input(TACH_PIN)
-                    if current_state == 1 and last_state == 0:
-                        pulse_count += 1
-                    last_state = current_state
-                    time.sleep(0.0001)
-                
-                # Recalculate elapsed time
-                elapsed_time = time.time() - start_time + (max_duration / 2)
-                self.logger.debug(f"Retry with pull-down: {pulse_count} pulses in {elapsed_time:.2f} seconds")
-            
-            # If still no pulses, try one more time with both edges
-            if pulse_count == 0:
-                self.logger.debug("No pulses detected, trying to detect any pin changes")
-                GPIO.setup(TACH_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-                time.sleep(0.01)
-                
-                # Try again detecting any change
-                start_time = time.time()
-                last_state = GPIO.input(TACH_PIN)
-                while time.time() - start_time < max_duration / 2:  # Half duration for retry
-                    current_state = GPIO.input(TACH_PIN)
-                    if current_state != last_state:  # Any change
-                        pulse_count += 1
-                        self.logger.debug(f"Pin change detected: {last_state} -> {current_state}")
-                    last_state = current_state
-                    time.sleep(0.0001)
-                
-                # Recalculate elapsed time
-                elapsed_time = time.time() - start_time + max_duration
-            
-            # Calculate RPM
-            if pulse_count == 0 or elapsed_time == 0:
-                self.logger.debug("No tach pulses detected at all")
-                return 0
-            
-            # Standard calculation for 2 pulses per revolution (most PC fans)
-            pulses_per_revolution = 2
-            rpm = (pulse_count * 60) / (pulses_per_revolution * elapsed_time)
-            
-            self.logger.debug(f"Calculated RPM: {rpm:.1f} from {pulse_count} pulses")
-            return rpm
-            
-        except Exception as e:
-            self.logger.error(f"Error reading tachometer: {e}")
-            import traceback
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+                # Sleep first, then drain everything the kernel buffered:
+                # one wakeup per interval instead of one per edge. A set
+                # stop event means stop() is about to release the line,
+                # so never touch the request again after it fires
+                if self._stop_event.wait(self.TACH_DRAIN_INTERVAL):
+                    break
+                if request.wait_edge_events(0):
+                    events = request.read_edge_events()
+                    with self._tach_lock:
+                        self._pulse_count += len(events)
+            except Exception:
+                self.logger.exception("Error draining tach events")
+                self._stop_event.wait(1)
+
+    def read_tach(self):
+        """
+        Calculate fan RPM from the rolling pulse counter
+
+        Pulses are accumulated continuously by _tach_drain_loop, so this
+        just snapshots the counter and divides by the elapsed time since
+        the previous snapshot -- no blocking measurement window inside
+        the control loop.
+        """
+        with self._tach_lock:
+            count = self._pulse_count
+        now = time.monotonic()
+
+        last_count, last_time = self._last_tach_snapshot
+        self._last_tach_snapshot = (count, now)
+
+        elapsed_time = now - last_time
+        if elapsed_time <= 0:
             return 0
 
-    def fan_control_loop(self):
-        """Main loop for temperature-based fan control"""
-        last_log_time = 0
-        while self.running:
-            try:
-                # Get temperature and adjust fan speed
-                temp = self.get_cpu_temperature()
-                duty_cycle = self.get_duty_cycle(temp)
-                if self.pwm:
-                    self.pwm.set_duty_cycle(duty_cycle)
-                
-                # Log periodically
-                current_time = time.time()
-                if current_time - last_log_time >= self.fan_settings['log_interval']:
-                    rpm = self.read_tach()
-                    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    self.logger.info(f"[{timestamp}] Temperature: {temp}°C, Duty Cycle: {duty_cycle}%, Fan Speed: {rpm:.0f} RPM")
-                    last_log_time = current_time
-                
-                # Wait for next cycle
-                time.sleep(TEMPERATURE_CHECK_INTERVAL)
-            except Exception as e:
-                self.logger.error(f"Error in fan control loop: {e}")
-                time.sleep(10)  # Wait before retrying
+        # Standard calculation for 2 pulses per revolution (most PC fans)
+        pulses_per_revolution = 2
+        rpm = ((count - last_count) * 60) / (pulses_per_revolution * elapsed_time)
+
+        self.logger.debug("Calculated RPM: %.1f from %d pulses", rpm, count - last_count)
+        return rpm
+
+    def control_loop(self):
+        """Unified scheduler for temperature control and tach monitoring
 
-    def tach_check_loop(self):
-        """Separate loop for checking fan operation"""
+        Runs both jobs on one thread: each keeps its own absolute
+        deadline and the loop sleeps until the nearer one. The tach
+        failure check reuses the duty cycle from the most recent
+        temperature pass instead of re-reading the sensor, so merging
+        the loops also halves the sensor traffic.
+        """
+        # Back-dated so the first pass always logs a status line
+        last_log_time = time.monotonic() - self.fan_settings['log_interval']
         warning_reported = False
-        while self.running:
+        duty_cycle = 0
+        next_temp_check = time.monotonic()
+        next_tach_check = next_temp_check + TACH_CHECK_INTERVAL
+
+        while not self._stop_event.is_set():
             try:
-                rpm = self.read_tach(duration=2)  # Longer measurement for more accuracy
-                
-                # Get current duty cycle for context
-                temp = self.get_cpu_temperature()
-                current_duty_cycle = self.get_duty_cycle(temp)
-                
-                # Check for potential fan failure
-                if current_duty_cycle > 20 and rpm < 100:
-                    # Only report fan failure if the duty cycle is high enough to expect movement
-                    if not warning_reported:
-                        self.logger.warning(f"Possible fan failure detected! Duty Cycle: {current_duty_cycle}%, but RPM: {rpm:.0f}")
-                        warning_reported = True
-                else:
-                    # Reset warning flag if RPMs are detected again
-                    if warning_reported and rpm >= 100:
-                        self.logger.info(f"Fan operation restored. Current RPM: {rpm:.0f}")
-                        warning_reported = False
-                        
-                time.sleep(TACH_CHECK_INTERVAL)
+                now = time.monotonic()
+                # At most one tach read per iteration, shared between
+                # the status log and the failure check
+                rpm = None
+
+                if now >= next_temp_check:
+                    # Get temperature and adjust fan speed; the curve
+                    # buckets temperatures, so in steady state the duty
+                    # is unchanged and the PWM write can be skipped
+                    temp = self.get_cpu_temperature()
+                    duty_cycle = self.get_duty_cycle(temp)
+                    if self.pwm and duty_cycle != self._last_duty:
+                        self.pwm.set_duty_cycle(duty_cycle)
+                        self._last_duty = duty_cycle
+
+                    # Log periodically; monotonic so an NTP step can't
+                    # fire the interval early or stall it
+                    current_time = time.monotonic()
+                    if current_time - last_log_time >= self.fan_settings['log_interval']:
+                        rpm = self.read_tach()
+                        # The log formatter already prints asctime; no
+                        # need to format a second timestamp here
+                        self.logger.info(f"Temperature: {temp}°C, Duty Cycle: {duty_cycle}%, Fan Speed: {rpm:.0f} RPM")
+                        last_log_time = current_time
+
+                    next_temp_check = now + TEMPERATURE_CHECK_INTERVAL
+
+                if now >= next_tach_check:
+                    # Reuse the RPM sampled for the log line above: the
+                    # snapshot-delta read_tach measures the window since
+                    # its previous call, so a second back-to-back call
+                    # would see a near-zero window and report 0 RPM
+                    if rpm is None:
+                        rpm = self.read_tach()
+
+                    # Check for potential fan failure
+                    if duty_cycle > 20 and rpm < 100:
+                        # Only report fan failure if the duty cycle is high enough to expect movement
+                        if not warning_reported:
+                            self.logger.warning(f"Possible fan failure detected! Duty Cycle: {duty_cycle}%, but RPM: {rpm:.0f}")
+                            warning_reported = True
+                    else:
+                        # Reset warning flag if RPMs are detected again
+                        if warning_reported and rpm >= 100:
+                            self.logger.info(f"Fan operation restored. Current RPM: {rpm:.0f}")
+                            warning_reported = False
+
+                    next_tach_check = now + TACH_CHECK_INTERVAL
+
+                # Sleep until the nearer deadline (or an immediate stop)
+                delay = min(next_temp_check, next_tach_check) - time.monotonic()
+                if delay > 0:
+                    self._stop_event.wait(delay)
             except Exception as e:
-                self.logger.error(f"Error in tach check loop: {e}")
-                time.sleep(60)  # Wait before retrying
+                self.logger.error(f"Error in fan control loop: {e}")
+                self._stop_event.wait(10)  # Wait before retrying
 
     def start(self):
         """Start the fan controller"""
         self.logger.info("Starting fan control service")
         
         try:
-            self.pwm = PWMController(PWM_LINE, PWM_FREQUENCY, logger=self.logger)
+            # Prefer the kernel's PWM peripheral; fall back to the
+            # software bit-banging thread if the overlay isn't enabled
+            try:
+                self.pwm = HardwarePWMController(PWM_FREQUENCY, logger=self.logger)
+            except OSError as e:
+                self.logger.warning(f"Hardware PWM unavailable ({e}), "
+                                    f"falling back to software PWM")
+                self.pwm = PWMController(PWM_LINE, PWM_FREQUENCY, logger=self.logger)
             self.pwm.start()
             
             # Mark as running and start control threads
-            self.running = True
+            self._stop_event.clear()
             
             # Start control threads
-            fan_control_thread = threading.Thread(target=self.fan_control_loop)
-            fan_control_thread.daemon = True
-            
-            tach_check_thread = threading.Thread(target=self.tach_check_loop)
-            tach_check_thread.daemon = True
-            
-            fan_control_thread.start()
-            tach_check_thread.start()
-            
+            control_thread = threading.Thread(target=self.control_loop)
+            control_thread.daemon = True
+
+            tach_drain_thread = threading.Thread(target=self._tach_drain_loop)
+            tach_drain_thread.daemon = True
+            self._drain_thread = tach_drain_thread
+
+            control_thread.start()
+            tach_drain_thread.start()
+
             self.logger.info("Fan control service started successfully")
+
+            # Return the control thread for the calling code to manage
+            return control_thread
             
-            # Return threads for the calling code to manage
-            return fan_control_thread, tach_check_thread
-            
-        except Exception as e:
-            self.logger.error(f"Error starting fan control service: {e}")
-            import traceback
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            self.logger.exception("Error starting fan control service")
             self.stop()
-            return None, None
+            return None
 
     def stop(self):
         """Stop the fan controller"""
         self.logger.info("Stopping fan control service")
-        self.running = False
+        self._stop_event.set()
         
-        # Clean up resources
+        # Failsafe: leave the fan running at full speed rather than
+        # disabling the PWM -- if the service doesn't come back, a
+        # stopped fan under a live SoC is the dangerous state
         if hasattr(self, 'pwm') and self.pwm:
-            self.pwm.stop()
+            try:
+                self.pwm.park()
+            except Exception:
+                self.logger.exception("Error parking PWM on stop")
             self.pwm = None
             
-        # Clean up GPIO pins individually
-        try:
-            # Clean up tach pin
+        # Let the drain thread notice the stop event before the line
+        # request it reads from is released
+        if self._drain_thread is not None:
+            self._drain_thread.join(timeout=self.TACH_DRAIN_INTERVAL + 1)
+            self._drain_thread = None
+
+        # Release the tach line request
+        if self._tach_request is not None:
             try:
-                GPIO.remove_event_detect(TACH_PIN)
-            except:
+                self._tach_request.release()
+            except Exception:
                 pass
-            GPIO.cleanup(TACH_PIN)
-            
-            # Clean up PWM pin
-            GPIO.cleanup(PWM_LINE)
-        except:
-            pass
-            
+            self._tach_request = None
+
+        # Close the persistent thermal zone handle
+        if self._temp_fd is not None:
+            self._temp_fd.close()
+            self._temp_fd = None
+
         self.logger.info("Fan control service stopped")
 
 
@@ -376,27 +608,42 @@ def run_fan_control(debug_mode=False):
     
     # Create fan controller with debug mode if requested
     controller = FanController(logger=logger, debug_mode=debug_mode)
-    
+
+    # Translate SIGTERM/SIGINT into the stop event so a systemd stop
+    # interrupts any interval wait immediately instead of relying on
+    # KeyboardInterrupt reaching the main thread
+    def _handle_signal(signum, frame):
+        logger.info("Received signal %s, shutting down", signum)
+        controller._stop_event.set()
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
     try:
         # Start fan controller
-        fan_thread, tach_thread = controller.start()
-        
-        # Keep main thread alive while threads are running
-        if fan_thread and tach_thread:
-            logger.info("Fan control threads started successfully")
-            while fan_thread.is_alive() and tach_thread.is_alive():
-                time.sleep(1)
-                
-            logger.error("One or more fan control threads has exited unexpectedly")
+        control_thread = controller.start()
+
+        # Keep main thread alive while the control thread is running
+        if control_thread:
+            logger.info("Fan control thread started successfully")
+            while control_thread.is_alive():
+                # Event-based wait: returns immediately once stop() is called
+                if controller._stop_event.wait(1.0):
+                    break
+
+            # Only a thread death without a stop request is an error;
+            # a signal-driven shutdown lands here too
+            if controller._stop_event.is_set():
+                logger.info("Stop requested, shutting down")
+            else:
+                logger.error("Fan control thread has exited unexpectedly")
         else:
-            logger.error("Failed to start fan control threads")
+            logger.error("Failed to start fan control thread")
             
     except KeyboardInterrupt:
         logger.info("Fan control stopped by user")
-    except Exception as e:
-        logger.error(f"Error in fan control service: {e}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+    except Exception:
+        logger.exception("Error in fan control service")
     finally:
         # Clean up
         controller.stop()
@@ -6,21 +6,30 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Resolved once at import: the key can't change without a restart, so
+# per-request env lookups buy nothing
+_ADMIN_KEY = os.getenv('COSMICAM_ADMIN_API_KEY')
+
+# Longest Authorization header worth inspecting; anything bigger is
+# malformed and would only pad out the constant-time compare
+_MAX_AUTH_HEADER_LEN = 256
+
 def require_admin_access(f):
     @wraps(f)
     def decorated(*args, **kwargs):
-        auth_header = request.headers.get('Authorization')
-        admin_key = os.getenv('COSMICAM_ADMIN_API_KEY')
-        
-        if not admin_key:
+        if not _ADMIN_KEY:
             return jsonify({'error': 'API key not configured'}), 500
-            
-        if not auth_header or not auth_header.startswith('Bearer '):
+
+        auth_header = request.headers.get('Authorization')
+        if (not auth_header or len(auth_header) > _MAX_AUTH_HEADER_LEN
+                or not auth_header.startswith('Bearer ')):
             return jsonify({'error': 'Missing authorization header'}), 401
-            
+
         api_key = auth_header[7:]  # Remove 'Bearer ' prefix
-        if not secrets.compare_digest(api_key, admin_key):
+        # A length mismatch only reveals that the key is malformed, so
+        # it is safe to skip the full compare in that case
+        if len(api_key) != len(_ADMIN_KEY) or not secrets.compare_digest(api_key, _ADMIN_KEY):
             return jsonify({'error': 'Invalid API key'}), 403
-            
+
         return f(*args, **kwargs)
-    return decorated
\ No newline at end of file
+    return decorated
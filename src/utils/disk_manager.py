@@ -1,26 +1,51 @@
 import os
-import glob
-import shutil
 import logging
-from typing import List
+import threading
+from typing import List, Tuple
 
 class DiskSpaceManager:
     """
     Manages disk space by enforcing storage limits for captured images.
     Automatically removes oldest images when storage limits are exceeded.
     """
-    def __init__(self, image_dir: str, max_disk_usage_gb: float, logger=None):
+    def __init__(self, image_dir: str, max_disk_usage_gb: float, logger=None,
+                 own_partition: bool = False):
         """
         Initialize the Disk Space Manager
-        
+
         Args:
             image_dir: Path to the directory containing images
             max_disk_usage_gb: Maximum allowed disk usage in GB
             logger: Optional logger instance
+            own_partition: True if image_dir is the only thing on its
+                filesystem, enabling the statvfs fast path for usage checks
         """
         self.image_dir = image_dir
         self.max_disk_usage_gb = max_disk_usage_gb
         self.logger = logger or logging.getLogger("SYSTEM")
+        self.own_partition = own_partition
+
+        # Incrementally tracked usage, maintained by note_added and
+        # note_removed; None until the first authoritative scan seeds it
+        self._known_bytes = None
+        self._known_lock = threading.Lock()
+
+    def note_added(self, size: int) -> None:
+        """Record bytes written to the image directory by the producer"""
+        with self._known_lock:
+            if self._known_bytes is not None:
+                self._known_bytes += size
+
+    def note_removed(self, size: int) -> None:
+        """Record bytes removed from the image directory"""
+        with self._known_lock:
+            if self._known_bytes is not None:
+                self._known_bytes = max(0, self._known_bytes - size)
+
+    def _partition_used_bytes(self) -> int:
+        """Used bytes on the image filesystem, in a single statvfs call"""
+        s = os.statvfs(self.image_dir)
+        return (s.f_blocks - s.f_bavail) * s.f_frsize
         
     def cleanup_if_needed(self) -> bool:
         """
@@ -31,91 +56,119 @@ class DiskSpaceManager:
         """
         # Convert GB to bytes for comparison
         max_bytes = self.max_disk_usage_gb * 1024 * 1024 * 1024
-        
-        # Get current size
-        dir_size = self._get_directory_size()
-        
+
+        # Fast path: the incrementally tracked total costs no syscalls.
+        # It can drift (files added outside the capture path), so the
+        # authoritative scan still runs once usage is within 5% of the
+        # limit, reconciling the counter
+        with self._known_lock:
+            known = self._known_bytes
+        if known is not None and known <= max_bytes * 0.95:
+            self.logger.debug(f"Disk usage (tracked: {known / (1024**3):.2f} GB) is within limits ({self.max_disk_usage_gb} GB)")
+            return False
+
+        # When the images have the filesystem to themselves, statvfs
+        # answers the over-limit question in one syscall instead of a
+        # directory walk; the scan below only runs once cleanup is due
+        if self.own_partition:
+            used = self._partition_used_bytes()
+            if used <= max_bytes:
+                self.logger.debug(f"Disk usage ({used / (1024**3):.2f} GB) is within limits ({self.max_disk_usage_gb} GB)")
+                return False
+
+        # One scan yields both the usage total and the cleanup ordering
+        dir_size, images = self._scan_images()
+        with self._known_lock:
+            self._known_bytes = dir_size
+
         # Check if cleanup needed
         if dir_size <= max_bytes:
             self.logger.debug(f"Disk usage ({dir_size / (1024**3):.2f} GB) is within limits ({self.max_disk_usage_gb} GB)")
             return False
-        
+
         # Perform cleanup
         self.logger.info(f"Disk usage ({dir_size / (1024**3):.2f} GB) exceeds limit ({self.max_disk_usage_gb} GB), cleaning up...")
-        
+
         # Calculate how much space to free up (remove enough to get to 90% of limit)
         target_size = max_bytes * 0.9
         bytes_to_remove = dir_size - target_size
-        
+
         # Remove oldest files
-        bytes_removed = self._remove_oldest_images(bytes_to_remove)
-        
+        bytes_removed = self._remove_oldest_images(bytes_to_remove, images)
+        self.note_removed(bytes_removed)
+
         self.logger.info(f"Cleanup complete: removed {bytes_removed / (1024**3):.2f} GB")
         return True
         
-    def _get_directory_size(self) -> int:
+    def _scan_images(self) -> Tuple[int, List[Tuple[int, str, int]]]:
         """
-        Calculate total size of images directory in bytes
-        
+        Scan the image directory once for total size and image listing
+
+        A single scandir walk replaces the separate size and glob+sort
+        passes the cleanup check used to make: the stat cached on each
+        DirEntry supplies both the size total and the ctime sort key,
+        so no file is statted twice.
+
         Returns:
-            int: Directory size in bytes
+            Tuple[int, List]: (total_bytes, images) where images holds
+            (st_ctime_ns, path, size) tuples for image files, sorted
+            oldest first
         """
         total_size = 0
-        for dirpath, _, filenames in os.walk(self.image_dir):
-            for f in filenames:
-                try:
-                    fp = os.path.join(dirpath, f)
-                    if not os.path.islink(fp):
-                        total_size += os.path.getsize(fp)
-                except (FileNotFoundError, PermissionError) as e:
-                    self.logger.warning(f"Error getting size of {f}: {str(e)}")
-        
-        return total_size
-        
-    def _get_images_sorted_by_age(self) -> List[str]:
-        """
-        Get a list of image files sorted by creation time (oldest first)
-        
-        Returns:
-            List[str]: Sorted list of image file paths
-        """
-        # Get all image files
-        image_pattern = os.path.join(self.image_dir, "image_*.jpg")
-        image_files = glob.glob(image_pattern)
-        
-        # Sort by creation time (oldest first)
-        image_files.sort(key=lambda x: os.path.getctime(x))
-        
-        return image_files
-    
-    def _remove_oldest_images(self, bytes_to_remove: float) -> int:
+        images: List[Tuple[int, str, int]] = []
+
+        def walk(path):
+            nonlocal total_size
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                walk(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                st = entry.stat(follow_symlinks=False)
+                                total_size += st.st_size
+                                if entry.name.startswith("image_") and entry.name.endswith(".jpg"):
+                                    images.append((st.st_ctime_ns, entry.path, st.st_size))
+                        except (FileNotFoundError, PermissionError) as e:
+                            self.logger.warning(f"Error getting size of {entry.name}: {str(e)}")
+            except OSError as e:
+                self.logger.warning(f"Error scanning {path}: {str(e)}")
+
+        walk(self.image_dir)
+        # Oldest first; integer ctime compares are cheap
+        images.sort()
+        return total_size, images
+
+    def _remove_oldest_images(self, bytes_to_remove: float,
+                              images: List[Tuple[int, str, int]]) -> int:
         """
         Remove oldest images until the specified amount of space is freed
-        
+
         Args:
             bytes_to_remove: Amount of space to free up in bytes
-            
+            images: (st_ctime_ns, path, size) tuples, oldest first
+
         Returns:
             int: Actual number of bytes removed
         """
         if bytes_to_remove <= 0:
             return 0
-            
+
         bytes_removed = 0
-        images = self._get_images_sorted_by_age()
-        
-        for image_path in images:
+
+        for _, image_path, file_size in images:
             if bytes_removed >= bytes_to_remove:
                 break
-                
+
             try:
-                file_size = os.path.getsize(image_path)
+                # Size comes from the scan pass; no stat before the unlink
                 os.remove(image_path)
                 bytes_removed += file_size
-                
+
                 self.logger.info(f"Removed {os.path.basename(image_path)} ({file_size / (1024**2):.2f} MB)")
-                
+
             except (FileNotFoundError, PermissionError) as e:
                 self.logger.error(f"Failed to remove {image_path}: {str(e)}")
-        
+
         return bytes_removed
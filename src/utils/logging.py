@@ -1,9 +1,28 @@
 import os
+import atexit
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 from src.config import config
 
+# One formatter shared by every handler; Formatter objects are
+# stateless at emit time, so there is no reason to build one per call
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(message)s')
+
+# Queue listeners started by setup_logger, stopped (and flushed) at
+# interpreter exit
+_listeners = []
+
+def _stop_listeners():
+    # Pop as we go so a second call (atexit after an explicit stop)
+    # never stops the same listener twice
+    while _listeners:
+        _listeners.pop().stop()
+
+atexit.register(_stop_listeners)
+
 def setup_logger(component: str, log_dir: Optional[str] = None) -> logging.Logger:
     """
     Set up a logger for a specific component
@@ -36,16 +55,18 @@ def setup_logger(component: str, log_dir: Optional[str] = None) -> logging.Logge
     if component not in log_files:
         raise ValueError(f"Unknown component: {component}")
 
-    # Create logger
+    # Create logger; loggers are process-global, so if this component was
+    # already configured just return it instead of re-opening log files
+    # and stacking duplicate handlers
     logger = logging.getLogger(component.upper())
+    if logger.handlers:
+        return logger
     logger.setLevel(logging.INFO)
 
-    # Clear any existing handlers
-    logger.handlers = []
-
-    # Create file handler
+    # Create file handler; delay=True defers the open() until the
+    # first record is actually emitted
     file_handler = logging.FileHandler(
-        os.path.join(log_dir, log_files[component])
+        os.path.join(log_dir, log_files[component]), delay=True
     )
     file_handler.setLevel(logging.INFO)
 
@@ -53,17 +74,17 @@ def setup_logger(component: str, log_dir: Optional[str] = None) -> logging.Logge
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
 
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(message)s'
-    )
-
     # Add formatter to handlers
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
+    file_handler.setFormatter(_FORMATTER)
+    console_handler.setFormatter(_FORMATTER)
 
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Route records through a queue so callers only pay an enqueue; the
+    # listener thread does the file and console I/O, keeping a slow
+    # disk write out of timing-sensitive loops like fan control
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+    _listeners.append(listener)
 
     return logger